@@ -0,0 +1,80 @@
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+import tierkreis.cli
+from tierkreis import TierkreisGraph
+from tierkreis.cli import cli
+from tierkreis.core.function import FunctionName
+from tierkreis.core.tierkreis_graph import FunctionNode
+from tierkreis.core.type_errors import TierkreisTypeErrors
+
+
+class _StubRuntime:
+    """Rejects any graph that calls a function named "bad"."""
+
+    def __init__(self) -> None:
+        self.checked = 0
+
+    async def type_check_graph(self, graph: TierkreisGraph) -> TierkreisGraph:
+        self.checked += 1
+        if any(
+            isinstance(n, FunctionNode) and n.function_name == FunctionName("bad")
+            for n in graph.nodes()
+        ):
+            raise TierkreisTypeErrors(errors=[])
+        return graph
+
+
+def _write_graph(path: Path, fname: str) -> str:
+    tg = TierkreisGraph()
+    tg.set_outputs(out=tg.add_func(fname, value=tg.input["in"]))
+    path.write_bytes(bytes(tg.to_proto()))
+    return str(path)
+
+
+def test_batch_reports_each_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    runtime = _StubRuntime()
+    opened = 0
+
+    @asynccontextmanager
+    async def stub_manager(host: str, port: int = 443):
+        nonlocal opened
+        opened += 1
+        yield runtime
+
+    monkeypatch.setattr(tierkreis.cli, "server_manager", stub_manager)
+
+    good = _write_graph(tmp_path / "good.bin", "id")
+    bad = _write_graph(tmp_path / "bad.bin", "bad")
+    corrupt = tmp_path / "corrupt.bin"
+    corrupt.write_bytes(b"\xff")
+    good2 = _write_graph(tmp_path / "good2.bin", "id")
+
+    result = CliRunner().invoke(cli, ["batch", good, bad, str(corrupt), good2])
+
+    assert result.exit_code == 1
+    assert opened == 1
+    # the corrupt file fails to decode and is never sent for checking
+    assert runtime.checked == 3
+    lines = result.output.splitlines()
+    assert any(line.startswith(f"{good}: ") and "ok" in line for line in lines)
+    assert any(line.startswith(f"{bad}: ") and "failed" in line for line in lines)
+    assert any(line.startswith(f"{corrupt}: ") and "failed" in line for line in lines)
+    assert any(line.startswith(f"{good2}: ") and "ok" in line for line in lines)
+    assert "Could not decode graph" in result.output
+
+
+def test_batch_all_ok(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    @asynccontextmanager
+    async def stub_manager(host: str, port: int = 443):
+        yield _StubRuntime()
+
+    monkeypatch.setattr(tierkreis.cli, "server_manager", stub_manager)
+
+    protos = [_write_graph(tmp_path / f"g{i}.bin", "id") for i in range(3)]
+    result = CliRunner().invoke(cli, ["batch", *protos])
+
+    assert result.exit_code == 0, result.output
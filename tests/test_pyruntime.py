@@ -2,8 +2,10 @@ import pytest
 from sample_graph import sample_graph as sample_g
 
 from tierkreis.core.tierkreis_graph import TierkreisEdge, TierkreisGraph
+from tierkreis.core.type_errors import TierkreisTypeErrors
 from tierkreis.core.values import TierkreisValue, VariantValue
 from tierkreis.pyruntime import PyRuntime
+from tierkreis.worker import Namespace
 
 
 @pytest.fixture()
@@ -24,3 +26,25 @@ async def test_callback(sample_graph: TierkreisGraph, pyruntime_function: PyRunt
     outs = await pyruntime_function.run_graph(sample_graph, **ins)
     assert all(e in cache for e in sample_graph.edges())
     assert sorted(outs) == sorted(sample_graph.outputs())
+
+
+@pytest.mark.skip_typecheck
+@pytest.mark.asyncio
+async def test_type_check_sees_later_functions():
+    root = Namespace()
+    late = root["late"]
+    runtime = PyRuntime([root])
+
+    tg = TierkreisGraph()
+    tg.set_outputs(out=tg.add_func("late::double", value=tg.add_const(2)))
+    with pytest.raises(TierkreisTypeErrors):
+        await runtime.type_check_graph(tg)
+
+    # registered after the runtime has already been used for type checking
+    @late.function()
+    async def double(value: int) -> int:
+        return value * 2
+
+    await runtime.type_check_graph(tg)
+    outs = await runtime.run_graph(tg)
+    assert outs["out"].try_autopython() == 4
@@ -24,6 +24,7 @@ from tierkreis.core.values import (
     FloatValue,
     IntValue,
     MapValue,
+    StructValue,
     TierkreisValue,
     TierkreisVariant,
     VecValue,
@@ -181,6 +182,17 @@ def test_value_topython_map_with_empty():
     assert pyval == pyval2
 
 
+def test_struct_value_anon_class():
+    s1 = StructValue({"a": IntValue(1), "b": FloatValue(2.0)})
+    s2 = StructValue({"a": IntValue(3), "b": FloatValue(4.0)})
+    s3 = StructValue({"b": FloatValue(4.0), "a": IntValue(3)})
+    assert s1.values == {"a": IntValue(1), "b": FloatValue(2.0)}
+    assert s2 != s1
+    assert s2 == s3
+    assert StructValue.from_proto_dict(s1.to_proto_dict()) == s1
+    assert TierkreisValue.from_proto(s2.to_proto()) == s2
+
+
 def test_inline_boxes():
     tg_box = TierkreisGraph()
 
@@ -35,12 +35,20 @@ async def server_manager(host: str, port: int = 443):
 
 def coro(f):
     @wraps(f)
-    def wrapper(*args, **kwargs):
-        return asyncio.run(f(*args, **kwargs))
+    def wrapper(ctx: click.Context, *args, **kwargs):
+        return ctx.obj["loop"].run_until_complete(f(ctx, *args, **kwargs))
 
     return wrapper
 
 
+def _close_loop(loop: asyncio.AbstractEventLoop):
+    try:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.run_until_complete(loop.shutdown_default_executor())
+    finally:
+        loop.close()
+
+
 def _inputs(proto_file: str, py_source: str) -> Dict[str, TierkreisValue]:
     if proto_file == "":
         return (
@@ -109,15 +117,17 @@ def run_with_signals(manager: AsyncContextManager):
     "-p",
     help="Runtime port, default=8090 if runtime is localhost, else 443",
 )
-@coro
-async def cli(ctx: click.Context, runtime: str, port: Optional[int]):
+def cli(ctx: click.Context, runtime: str, port: Optional[int]):
     local = runtime == "localhost"
     if port is None:
         port = 8090 if local else 443
     ctx.ensure_object(dict)
     ctx.obj["runtime_label"] = runtime
+    # One event loop shared by whichever subcommand runs, closed on exit.
+    loop = asyncio.new_event_loop()
+    ctx.call_on_close(lambda: _close_loop(loop))
+    ctx.obj["loop"] = loop
     client_manager = server_manager(runtime, port)
-    asyncio.get_event_loop()
     ctx.obj["client_manager"] = client_manager
 
 
@@ -133,6 +143,34 @@ async def check(ctx: click.Context, proto: str) -> TierkreisGraph:
     return tkg
 
 
+@cli.command()
+@click.argument("protos", type=click.Path(exists=True), nargs=-1, required=True)
+@click.pass_context
+@coro
+async def batch(ctx: click.Context, protos: tuple[str, ...]):
+    """Type check each of PROTOS against runtime signature over one connection."""
+    failed = False
+    async with ctx.obj["client_manager"] as client:
+        for proto in protos:
+            try:
+                tkg = await _parse(Path(proto))
+            except Exception as e:
+                # betterproto and from_proto raise assorted errors on bad input
+                failed = True
+                print(f"{proto}: " + chalk.bold.red("failed"))
+                _print_typeerrs(f"Could not decode graph: {e!r}")
+                continue
+            try:
+                await client.type_check_graph(tkg)
+                print(f"{proto}: " + chalk.bold.green("ok"))
+            except TierkreisTypeErrors:
+                failed = True
+                print(f"{proto}: " + chalk.bold.red("failed"))
+                _print_typeerrs(traceback.format_exc(0))
+    if failed:
+        sys.exit(1)
+
+
 @cli.command()
 @click.argument("proto", type=click.Path(exists=True))
 @click.argument(
@@ -7,6 +7,7 @@ import warnings
 from abc import ABC, abstractmethod
 from dataclasses import Field, dataclass, fields, make_dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import (
     Any,
     Callable,
@@ -483,13 +484,18 @@ class DataclassInstance(Protocol):
 RowStruct = TypeVar("RowStruct", bound=DataclassInstance)
 
 
+@lru_cache(maxsize=1024)
+def _anon_struct_cls(field_names: tuple[str, ...]) -> type:
+    # Synthesizing a dataclass is expensive, so share one per set of field names.
+    return make_dataclass("__AnonStruct", field_names)
+
+
 class StructValue(Generic[RowStruct], TierkreisValue):
     _proto_name: ClassVar[str] = "struct"
     _struct: RowStruct
 
     def __init__(self, values: dict[str, TierkreisValue]) -> None:
-        __AnonStruct = make_dataclass("__AnonStruct", values.keys())
-        self._struct = __AnonStruct(**values)
+        self._struct = _anon_struct_cls(tuple(values.keys()))(**values)
 
     def __eq__(self, __o: object) -> bool:
         if not isinstance(__o, StructValue):